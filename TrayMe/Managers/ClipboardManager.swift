@@ -16,19 +16,39 @@ class ClipboardManager: ObservableObject {
     private var changeCount: Int = 0
     private var timer: Timer?
     
+    // Debounce saves - a burst of copies or favorite toggles becomes one disk write.
+    // Cleared once the write lands, so flushing with nothing pending does no work
+    private var saveWorkItem: DispatchWorkItem?
+    private let saveDebounceInterval: TimeInterval = 0.5
+    // Debounced and flushed writes share one serial queue, so they land in order
+    private static let saveQueue = DispatchQueue(label: "TrayMe.ClipboardManager.save", qos: .utility)
+    private var terminationObserver: NSObjectProtocol?
+    
     // Settings
     var maxHistorySize: Int = 100
     var ignorePasswordManagers: Bool = true
-    private let passwordManagerBundleIds = [
+    private let passwordManagerBundleIds: Set<String> = [
         "com.agilebits.onepassword",
         "com.lastpass.LastPass",
         "com.bitwarden.desktop",
         "com.dashlane.Dashlane"
     ]
     
+    // Link detector is compiled once and reused for every clipboard change
+    private static let linkDetector = try? NSDataDetector(types: NSTextCheckingResult.CheckingType.link.rawValue)
+    
     init() {
         loadFromDisk()
         startMonitoring()
+        
+        // A copy made just before quitting would otherwise die with the debounce
+        terminationObserver = NotificationCenter.default.addObserver(
+            forName: NSApplication.willTerminateNotification,
+            object: nil,
+            queue: .main
+        ) { [weak self] _ in
+            self?.flush()
+        }
     }
     
     func startMonitoring() {
@@ -84,7 +104,7 @@ class ClipboardManager: ObservableObject {
             
             // Limit history size
             if self.items.count > self.maxHistorySize {
-                self.items = Array(self.items.prefix(self.maxHistorySize))
+                self.items.removeLast(self.items.count - self.maxHistorySize)
             }
             
             self.saveToDisk()
@@ -92,11 +112,15 @@ class ClipboardManager: ObservableObject {
     }
     
     private func determineType(content: String) -> ClipboardItem.ClipboardType {
-        // Check if URL
-        if let detector = try? NSDataDetector(types: NSTextCheckingResult.CheckingType.link.rawValue),
-           let match = detector.firstMatch(in: content, range: NSRange(content.startIndex..., in: content)),
-           match.range.length == content.count {
-            return .url
+        // Check if URL - a link that spans the whole content can't contain
+        // whitespace, so prose and code skip the detector entirely
+        if !content.contains(where: { $0.isWhitespace }),
+           let detector = ClipboardManager.linkDetector {
+            let fullRange = NSRange(content.startIndex..., in: content)
+            if let match = detector.firstMatch(in: content, range: fullRange),
+               match.range.length == fullRange.length {
+                return .url
+            }
         }
         
         // Check if code (simple heuristic)
@@ -162,29 +186,60 @@ class ClipboardManager: ObservableObject {
     
     // MARK: - Persistence
     
-    private var saveURL: URL {
+    // Computed once - saves used to re-resolve the folder and mkdir on every write
+    nonisolated private static let saveURL: URL = {
         let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first!
         let appFolder = appSupport.appendingPathComponent("TrayMe", isDirectory: true)
         try? FileManager.default.createDirectory(at: appFolder, withIntermediateDirectories: true)
         return appFolder.appendingPathComponent("clipboard.json")
-    }
+    }()
     
     func saveToDisk() {
-        let encoder = JSONEncoder()
-        encoder.dateEncodingStrategy = .iso8601
+        // Cancel any pending save
+        saveWorkItem?.cancel()
+        
+        // Snapshot on the caller's (main) thread so the background encode
+        // never reads `items` mid-mutation
+        let snapshot = items
+        let workItem = DispatchWorkItem {
+            let encoder = JSONEncoder.persistence
+            
+            if let data = try? encoder.encode(snapshot) {
+                // The TrayMe folder can be deleted while we run - recreating it is a no-op otherwise
+                try? FileManager.default.createDirectory(at: ClipboardManager.saveURL.deletingLastPathComponent(), withIntermediateDirectories: true)
+                try? data.write(to: ClipboardManager.saveURL, options: .atomic)
+            }
+        }
+        
+        // Done writing - nothing pending unless a newer save replaced this one
+        workItem.notify(queue: .main) { [weak self] in
+            if self?.saveWorkItem === workItem {
+                self?.saveWorkItem = nil
+            }
+        }
+        
+        saveWorkItem = workItem
+        ClipboardManager.saveQueue.asyncAfter(deadline: .now() + saveDebounceInterval, execute: workItem)
+    }
+    
+    // Run the pending debounced save and wait for it (used on app termination)
+    func flush() {
+        guard let workItem = saveWorkItem else { return }
+        saveWorkItem = nil
         
-        if let data = try? encoder.encode(items) {
-            try? data.write(to: saveURL)
+        // Ordered after any write already in flight on the save queue
+        ClipboardManager.saveQueue.sync {
+            workItem.perform()
+            workItem.cancel() // The queued copy has nothing left to write
         }
     }
     
     func loadFromDisk() {
-        guard FileManager.default.fileExists(atPath: saveURL.path) else { return }
+        guard FileManager.default.fileExists(atPath: ClipboardManager.saveURL.path) else { return }
         
-        let decoder = JSONDecoder()
-        decoder.dateDecodingStrategy = .iso8601
+        let decoder = JSONDecoder.persistence
         
-        if let data = try? Data(contentsOf: saveURL),
+        if let data = try? Data(contentsOf: ClipboardManager.saveURL, options: .mappedIfSafe),
            let decoded = try? decoder.decode([ClipboardItem].self, from: data) {
             self.items = decoded
             self.favorites = decoded.filter { $0.isFavorite }
@@ -7,9 +7,12 @@ import SwiftUI
 import AppKit
 import Combine
 import CryptoKit
+import ImageIO
 
 class FilesManager: ObservableObject {
-    @Published var files: [FileItem] = []
+    @Published var files: [FileItem] = [] {
+        didSet { filteredFilesCache = nil }
+    }
     @Published var searchText: String = ""
     @Published var isLoading: Bool = false
     @AppStorage("shouldCopyFiles") var shouldCopyFiles: Bool = false
@@ -19,6 +22,18 @@ class FilesManager: ObservableObject {
     private var saveWorkItem: DispatchWorkItem?
     private let saveDebounceInterval: TimeInterval = 0.5 // Wait 500ms before saving
     
+    // Drops run their copies on one serial queue - two batches picking storage names
+    // at the same time could choose the same name and fail the second copy
+    private static let fileProcessingQueue = DispatchQueue(label: "TrayMe.FilesManager.fileProcessing", qos: .userInitiated)
+    
+    // Batches still being processed on that queue. They count toward the file limit
+    // and the duplicate check until they are inserted into `files`.
+    private var pendingBatches: [UUID: (urls: [URL], isStored: Bool)] = [:]
+    
+    var pendingFileCount: Int {
+        pendingBatches.values.reduce(0) { $0 + $1.urls.count }
+    }
+    
     // Computed property to enforce max limit of 100
     var maxFiles: Int {
         get { min(storedMaxFiles, 100) }
@@ -26,7 +41,9 @@ class FilesManager: ObservableObject {
     }
     
     // Fast thumbnail cache directory - uses Caches (cleaned by system when needed)
-    private static let thumbnailCacheDir: URL? = {
+    // The thumbnail helpers below are nonisolated: FileCard and the prewarm pass call
+    // them from background tasks, and hopping to main would serialize every decode
+    nonisolated private static let thumbnailCacheDir: URL? = {
         guard let appSupport = FileManager.default.urls(for: .cachesDirectory, in: .userDomainMask).first else {
             print("❌ Could not access Caches directory")
             return nil
@@ -37,7 +54,9 @@ class FilesManager: ObservableObject {
     }()
     
     // Fast bookmark cache directory - separate from JSON for speed
-    private static let bookmarkCacheDir: URL? = {
+    // Bookmark helpers are nonisolated - FileItem.resolvedURL and the bookmark
+    // writers/cleanup run them off the main actor
+    nonisolated private static let bookmarkCacheDir: URL? = {
         guard let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first else {
             print("❌ Could not access Application Support directory")
             return nil
@@ -48,59 +67,221 @@ class FilesManager: ObservableObject {
     }()
     
     // Generate cache key from file ID (fast, unique)
-    static func bookmarkCacheKey(for fileID: UUID) -> String {
+    nonisolated static func bookmarkCacheKey(for fileID: UUID) -> String {
         return fileID.uuidString + ".bookmark"
     }
     
     // Save bookmark to separate file (much faster than JSON)
-    static func saveBookmark(_ data: Data, for fileID: UUID) {
+    nonisolated static func saveBookmark(_ data: Data, for fileID: UUID) {
         guard let cacheDir = bookmarkCacheDir else { return }
         let cacheFile = cacheDir.appendingPathComponent(bookmarkCacheKey(for: fileID))
         try? data.write(to: cacheFile, options: .atomic)
     }
     
     // Load bookmark from cache
-    static func loadBookmark(for fileID: UUID) -> Data? {
+    nonisolated static func loadBookmark(for fileID: UUID) -> Data? {
         guard let cacheDir = bookmarkCacheDir else { return nil }
         let cacheFile = cacheDir.appendingPathComponent(bookmarkCacheKey(for: fileID))
         return try? Data(contentsOf: cacheFile)
     }
     
     // Delete bookmark from cache
-    static func deleteBookmark(for fileID: UUID) {
+    nonisolated static func deleteBookmark(for fileID: UUID) {
         guard let cacheDir = bookmarkCacheDir else { return }
         let cacheFile = cacheDir.appendingPathComponent(bookmarkCacheKey(for: fileID))
         try? FileManager.default.removeItem(at: cacheFile)
     }
     
+    // Sweep bookmark files that no saved FileItem points to (left behind when the app
+    // quit before a removal was saved). Runs once after launch, in the background.
+    // Bookmarks written after the sweep starts are skipped so in-flight drops keep theirs.
+    private static func removeOrphanedBookmarks(keeping fileIDs: Set<UUID>) {
+        guard let cacheDir = bookmarkCacheDir else { return }
+        let sweepStart = Date()
+        
+        DispatchQueue.global(qos: .background).async {
+            guard let entries = try? FileManager.default.contentsOfDirectory(
+                at: cacheDir,
+                includingPropertiesForKeys: [.contentModificationDateKey],
+                options: .skipsHiddenFiles
+            ) else { return }
+            
+            var removedCount = 0
+            for entry in entries where entry.pathExtension == "bookmark" {
+                guard let fileID = UUID(uuidString: entry.deletingPathExtension().lastPathComponent),
+                      !fileIDs.contains(fileID) else { continue }
+                
+                if let modified = try? entry.resourceValues(forKeys: [.contentModificationDateKey]).contentModificationDate,
+                   modified >= sweepStart {
+                    continue
+                }
+                
+                try? FileManager.default.removeItem(at: entry)
+                removedCount += 1
+            }
+            
+            #if DEBUG
+            if removedCount > 0 {
+                print("🧹 Removed \(removedCount) orphaned bookmarks")
+            }
+            #endif
+        }
+    }
+    
     // Generate cache key from file URL (hash for short, filesystem-safe names)
-    static func thumbnailCacheKey(for fileURL: URL) -> String {
-        let path = fileURL.standardizedFileURL.path
-        let hash = SHA256.hash(data: Data(path.utf8))
-        return hash.compactMap { String(format: "%02x", $0) }.joined().prefix(32) + ".png"
+    // Modification date + size are part of the key, so an edited image gets a fresh
+    // thumbnail while an unchanged one keeps hitting the cache
+    nonisolated static func thumbnailCacheKey(for fileURL: URL) -> String {
+        var keySource = fileURL.standardizedFileURL.path
+        if let values = try? fileURL.resourceValues(forKeys: [.contentModificationDateKey, .fileSizeKey]),
+           let modified = values.contentModificationDate,
+           let size = values.fileSize {
+            keySource += "|\(modified.timeIntervalSinceReferenceDate)|\(size)"
+        }
+        let hash = SHA256.hash(data: Data(keySource.utf8))
+        
+        // Hex-encode only the 16 bytes we keep, straight into one buffer
+        // (String(format:) per byte allocated 32 strings and then joined them)
+        var hex = [UInt8]()
+        hex.reserveCapacity(32)
+        for byte in hash.prefix(16) {
+            hex.append(hexDigits[Int(byte >> 4)])
+            hex.append(hexDigits[Int(byte & 0x0f)])
+        }
+        return String(decoding: hex, as: UTF8.self) + ".png"
+    }
+    
+    nonisolated private static let hexDigits = Array("0123456789abcdef".utf8)
+    
+    // Bounded in-memory layer over the disk cache - cards are recreated every time the
+    // panel reopens or the grid scrolls, and each hit used to re-read and decode a PNG.
+    // NSCache is thread-safe and drops entries under memory pressure.
+    nonisolated(unsafe) private static let thumbnailMemoryCache: NSCache<NSString, NSImage> = {
+        let cache = NSCache<NSString, NSImage>()
+        cache.countLimit = 100 // Matches the maximum file limit
+        return cache
+    }()
+    
+    // Get cached thumbnail (memory first, then a single file read)
+    nonisolated static func getCachedThumbnail(for fileURL: URL) -> NSImage? {
+        let key = thumbnailCacheKey(for: fileURL)
+        if let image = thumbnailMemoryCache.object(forKey: key as NSString) {
+            return image
+        }
+        
+        guard let cacheDir = thumbnailCacheDir,
+              let image = NSImage(contentsOf: cacheDir.appendingPathComponent(key)) else {
+            return nil
+        }
+        thumbnailMemoryCache.setObject(image, forKey: key as NSString)
+        return image
     }
     
-    // Get cached thumbnail (super fast - just file read)
-    static func getCachedThumbnail(for fileURL: URL) -> NSImage? {
-        guard let cacheDir = thumbnailCacheDir else { return nil }
-        let cacheFile = cacheDir.appendingPathComponent(thumbnailCacheKey(for: fileURL))
-        return NSImage(contentsOf: cacheFile)
+    // Build a thumbnail with ImageIO - decodes at thumbnail size (hardware decoder for
+    // JPEG/HEIC where available) instead of decoding the full image and redrawing it
+    nonisolated static func makeThumbnail(for fileURL: URL, maxPixelSize: Int = 160) -> NSImage? {
+        let sourceOptions = [kCGImageSourceShouldCache: false] as CFDictionary
+        guard let source = CGImageSourceCreateWithURL(fileURL as CFURL, sourceOptions) else { return nil }
+        
+        let thumbnailOptions = [
+            kCGImageSourceCreateThumbnailFromImageAlways: true,
+            kCGImageSourceCreateThumbnailWithTransform: true,
+            kCGImageSourceShouldCacheImmediately: true,
+            kCGImageSourceThumbnailMaxPixelSize: maxPixelSize
+        ] as CFDictionary
+        
+        guard let cgImage = CGImageSourceCreateThumbnailAtIndex(source, 0, thumbnailOptions) else { return nil }
+        return NSImage(cgImage: cgImage, size: NSSize(width: cgImage.width, height: cgImage.height))
     }
     
     // Save thumbnail to cache (PNG is fast and small)
-    static func cacheThumbnail(_ image: NSImage, for fileURL: URL) {
+    nonisolated static func cacheThumbnail(_ image: NSImage, for fileURL: URL) {
         guard let cacheDir = thumbnailCacheDir else { return }
-        guard let tiffData = image.tiffRepresentation,
-              let bitmap = NSBitmapImageRep(data: tiffData),
-              let pngData = bitmap.representation(using: .png, properties: [:]) else {
+        // Encode from the backing CGImage directly - going through tiffRepresentation
+        // built (and re-parsed) an uncompressed TIFF copy of every thumbnail first
+        guard let cgImage = image.cgImage(forProposedRect: nil, context: nil, hints: nil),
+              let pngData = NSBitmapImageRep(cgImage: cgImage).representation(using: .png, properties: [:]) else {
             return
         }
         
-        let cacheFile = cacheDir.appendingPathComponent(thumbnailCacheKey(for: fileURL))
-        try? pngData.write(to: cacheFile, options: .atomic)
+        let key = thumbnailCacheKey(for: fileURL)
+        thumbnailMemoryCache.setObject(image, forKey: key as NSString)
+        try? pngData.write(to: cacheDir.appendingPathComponent(key), options: .atomic)
     }
     
-    private var storageFolderURL: URL? {
+    // Fill the thumbnail cache for image files after launch, at background priority,
+    // so the first time a card appears it hits the cache instead of decoding the image.
+    // Entries no current file maps to are swept afterwards (see removeStaleThumbnails)
+    nonisolated private static func prewarmThumbnails(for files: [FileItem]) {
+        guard let cacheDir = thumbnailCacheDir else { return }
+        let sweepStart = Date()
+        
+        DispatchQueue.global(qos: .background).async {
+            var liveKeys = Set<String>()
+            
+            for file in files where file.isImage {
+                guard let resolvedURL = file.resolvedURL() else { continue }
+                
+                let isAccessing = resolvedURL.startAccessingSecurityScopedResource()
+                defer {
+                    if isAccessing {
+                        resolvedURL.stopAccessingSecurityScopedResource()
+                    }
+                }
+                
+                let key = thumbnailCacheKey(for: resolvedURL)
+                liveKeys.insert(key)
+                
+                let cacheFile = cacheDir.appendingPathComponent(key)
+                guard !FileManager.default.fileExists(atPath: cacheFile.path) else { continue }
+                
+                autoreleasepool {
+                    if let thumbnail = makeThumbnail(for: resolvedURL) {
+                        cacheThumbnail(thumbnail, for: resolvedURL)
+                    }
+                }
+            }
+            
+            removeStaleThumbnails(in: cacheDir, keeping: liveKeys, olderThan: sweepStart)
+        }
+    }
+    
+    // The cache key includes mtime and size, so editing or removing an image leaves its
+    // old PNG behind with nothing pointing at it. Delete every thumbnail that isn't keyed
+    // by a current file. Thumbnails written after the sweep starts (new drops, cards
+    // appearing meanwhile) are kept.
+    nonisolated private static func removeStaleThumbnails(in cacheDir: URL, keeping liveKeys: Set<String>, olderThan sweepStart: Date) {
+        guard let entries = try? FileManager.default.contentsOfDirectory(
+            at: cacheDir,
+            includingPropertiesForKeys: [.contentModificationDateKey],
+            options: .skipsHiddenFiles
+        ) else { return }
+        
+        var removedCount = 0
+        for entry in entries where entry.pathExtension == "png" {
+            guard !liveKeys.contains(entry.lastPathComponent) else { continue }
+            
+            if let modified = try? entry.resourceValues(forKeys: [.contentModificationDateKey]).contentModificationDate,
+               modified >= sweepStart {
+                continue
+            }
+            
+            try? FileManager.default.removeItem(at: entry)
+            removedCount += 1
+        }
+        
+        #if DEBUG
+        if removedCount > 0 {
+            print("🧹 Removed \(removedCount) stale thumbnails")
+        }
+        #endif
+    }
+    
+    // Path resolved once - this used to run createDirectory on every access, including
+    // once per existing file inside the addFiles duplicate filter.
+    // The folder itself can disappear at runtime (it's opened in Finder for the user),
+    // so copyFileToStorage recreates it before each copy; the URL stays valid either way.
+    nonisolated private static let storageFolderURL: URL? = {
         guard let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first else {
             print("❌ Failed to locate Application Support directory")
             return nil
@@ -110,12 +291,11 @@ class FilesManager: ObservableObject {
         
         do {
             try FileManager.default.createDirectory(at: filesFolder, withIntermediateDirectories: true)
-            return filesFolder
         } catch {
             print("❌ Failed to create storage folder: \(error.localizedDescription)")
-            return nil
         }
-    }
+        return filesFolder
+    }()
     
     init() {
         let startTime = CFAbsoluteTimeGetCurrent()
@@ -132,17 +312,18 @@ class FilesManager: ObservableObject {
     private func loadFromDisk() {
         let startTime = CFAbsoluteTimeGetCurrent()
         
-        guard FileManager.default.fileExists(atPath: saveURL.path) else {
+        guard FileManager.default.fileExists(atPath: FilesManager.saveURL.path) else {
             print("📁 No saved files to load")
             return 
         }
         
         // Load in background to avoid blocking app launch
         DispatchQueue.global(qos: .userInitiated).async {
-            let decoder = JSONDecoder()
-            decoder.dateDecodingStrategy = .iso8601
+            let decoder = JSONDecoder.persistence
             
-            guard let data = try? Data(contentsOf: self.saveURL),
+            // Map the file rather than copying it into a heap buffer - saves replace
+            // it atomically, so the mapping stays valid for the whole decode
+            guard let data = try? Data(contentsOf: FilesManager.saveURL, options: .mappedIfSafe),
                   let decoded = try? decoder.decode([FileItem].self, from: data) else {
                 print("❌ Failed to load/decode files")
                 return
@@ -153,7 +334,11 @@ class FilesManager: ObservableObject {
             DispatchQueue.main.async {
                 self.files = decoded
                 print("📁 Loaded \(decoded.count) files in \(String(format: "%.3f", loadTime))s")
+                
+                FilesManager.removeOrphanedBookmarks(keeping: Set(decoded.map { $0.id }))
             }
+            
+            FilesManager.prewarmThumbnails(for: decoded)
         }
         
         print("📁 Starting background load...")
@@ -189,12 +374,11 @@ class FilesManager: ObservableObject {
                 // Remove oldest files beyond limit
                 let toRemove = self.files.suffix(self.files.count - self.maxFiles)
                 for file in toRemove {
-                    if let storageFolder = self.storageFolderURL, 
-                       self.isFileInStorage(file.url, storageFolder: storageFolder) {
+                    if FilesManager.isFileInStorage(file.url) {
                         try? FileManager.default.removeItem(at: file.url)
                     }
                 }
-                self.files = Array(self.files.prefix(self.maxFiles))
+                self.files.removeLast(self.files.count - self.maxFiles)
             }
             
             self.saveToDisk()
@@ -226,26 +410,43 @@ class FilesManager: ObservableObject {
         }.value
     }
     
-    private func copyFileToStorage(_ sourceURL: URL) -> URL? {
-        guard let storageFolder = storageFolderURL else {
+    // nonisolated - runs on the file processing queue, not main
+    nonisolated private func copyFileToStorage(_ sourceURL: URL) -> URL? {
+        guard let storageFolder = FilesManager.storageFolderURL else {
             print("❌ Storage folder unavailable, cannot copy file")
             return nil
         }
         
+        // Cheap when it already exists - covers the folder being deleted in Finder
+        do {
+            try FileManager.default.createDirectory(at: storageFolder, withIntermediateDirectories: true)
+        } catch {
+            print("❌ Failed to create storage folder: \(error.localizedDescription)")
+            return nil
+        }
+        
         let fileName = sourceURL.lastPathComponent
         let destinationURL = storageFolder.appendingPathComponent(fileName)
         
+        // Read the folder listing once instead of stat-ing every candidate name
+        // (lowercased - the default APFS volume is case-insensitive)
+        let existingNames = Set(((try? FileManager.default.contentsOfDirectory(atPath: storageFolder.path)) ?? []).map { $0.lowercased() })
+        
         // Prevent infinite loop - limit retries to 1000
         let maxRetries = 1000
         var finalURL = destinationURL
         var counter = 1
         
-        while FileManager.default.fileExists(atPath: finalURL.path) && counter < maxRetries {
+        if existingNames.contains(fileName.lowercased()) {
             let nameWithoutExt = sourceURL.deletingPathExtension().lastPathComponent
             let ext = sourceURL.pathExtension
-            let newName = "\(nameWithoutExt) \(counter).\(ext)"
-            finalURL = storageFolder.appendingPathComponent(newName)
-            counter += 1
+            var candidate = fileName
+            
+            while existingNames.contains(candidate.lowercased()) && counter < maxRetries {
+                candidate = "\(nameWithoutExt) \(counter).\(ext)"
+                counter += 1
+            }
+            finalURL = storageFolder.appendingPathComponent(candidate)
         }
         
         // Safety check - if we hit max retries, abort
@@ -272,31 +473,32 @@ class FilesManager: ObservableObject {
         // Smart duplicate filtering:
         // - Block if same file already exists in same mode (reference or stored)
         // - Allow if switching modes (reference -> copy or copy -> reference)
-        let newURLs = urls.filter { url in
-            let standardizedURL = url.standardizedFileURL
-            
-            // Check if we already have this file in the SAME mode
-            let hasDuplicate = files.contains { existingFile in
-                let existingStandardized = existingFile.url.standardizedFileURL
-                
-                // If storage folder is unavailable, treat all files as duplicates to be safe
-                guard let storageFolder = storageFolderURL else { return true }
-                
-                let isExistingStored = isFileInStorage(existingFile.url, storageFolder: storageFolder)
-                let willBeStored = shouldCopyFiles
-                
-                // Same file, same mode = duplicate
-                if existingStandardized.path == standardizedURL.path && isExistingStored == willBeStored {
-                    return true
-                }
-                
-                // If modes match, check by name (handles stored copies from same source)
-                if isExistingStored == willBeStored && existingFile.name == url.lastPathComponent {
-                    return true
-                }
-                
-                return false
+        // Index the existing files in the mode we're about to add in (one pass),
+        // so each dropped URL is a set lookup instead of a scan over every file
+        let willBeStored = shouldCopyFiles
+        var pathsInMode = Set<String>()
+        var namesInMode = Set<String>()
+        for existingFile in files where FilesManager.isFileInStorage(existingFile.url) == willBeStored {
+            pathsInMode.insert(existingFile.url.standardizedFileURL.path)
+            namesInMode.insert(existingFile.name)
+        }
+        // Include drops that are still being copied - they aren't in `files` yet
+        for batch in pendingBatches.values where batch.isStored == willBeStored {
+            for url in batch.urls {
+                pathsInMode.insert(url.standardizedFileURL.path)
+                namesInMode.insert(url.lastPathComponent)
             }
+        }
+        
+        // If storage folder is unavailable, treat all files as duplicates to be safe
+        let storageUnavailable = FilesManager.storageFolderURL == nil && !files.isEmpty
+        
+        let newURLs = urls.filter { url in
+            // Same file, same mode = duplicate
+            // If modes match, also check by name (handles stored copies from same source)
+            let hasDuplicate = storageUnavailable
+                || pathsInMode.contains(url.standardizedFileURL.path)
+                || namesInMode.contains(url.lastPathComponent)
             
             #if DEBUG
             if hasDuplicate {
@@ -320,41 +522,56 @@ class FilesManager: ObservableObject {
         }
         
         // Process files in batch
-        var newFiles: [FileItem] = []
-        
-        for url in newURLs {
-            // Copy file if setting is enabled, otherwise just reference
-            let finalURL: URL
-            if shouldCopyFiles {
-                if let copiedURL = copyFileToStorage(url) {
-                    finalURL = copiedURL
+        // Copying (and the per-file stat in FileItem.init) runs off the main thread so
+        // large drops don't stall the UI; the finished batch is handed back to main
+        let copyFiles = shouldCopyFiles
+        let batchID = UUID()
+        pendingBatches[batchID] = (urls: newURLs, isStored: copyFiles)
+        
+        FilesManager.fileProcessingQueue.async {
+            // One FileItem per URL - size the buffer once instead of regrowing it
+            var newFiles: [FileItem] = []
+            newFiles.reserveCapacity(newURLs.count)
+            
+            for url in newURLs {
+                // Copy file if setting is enabled, otherwise just reference
+                let finalURL: URL
+                if copyFiles {
+                    if let copiedURL = self.copyFileToStorage(url) {
+                        finalURL = copiedURL
+                    } else {
+                        print("⚠️ Failed to copy file \(url.lastPathComponent), using reference instead")
+                        finalURL = url
+                    }
                 } else {
-                    print("⚠️ Failed to copy file \(url.lastPathComponent), using reference instead")
                     finalURL = url
                 }
-            } else {
-                finalURL = url
+                
+                let newFile = FileItem(url: finalURL)
+                newFiles.append(newFile)
             }
             
-            let newFile = FileItem(url: finalURL)
-            newFiles.append(newFile)
-        }
-        
-        // Add all new files at once
-        DispatchQueue.main.async {
-            self.files.insert(contentsOf: newFiles, at: 0)
-            self.saveToDisk()
-        }
-        
-        // Create bookmarks in background (non-blocking)
-        if !shouldCopyFiles {
-            DispatchQueue.global(qos: .utility).async {
-                for var file in newFiles {
-                    file.populateMetadata()
-                    
-                    if let bookmarkData = file.bookmarkData {
-                        FilesManager.saveBookmark(bookmarkData, for: file.id)
-                        print("📑 Saved bookmark to cache for: \(file.name)")
+            // Add all new files at once
+            DispatchQueue.main.async {
+                self.pendingBatches[batchID] = nil
+                self.files.insert(contentsOf: newFiles, at: 0)
+                self.saveToDisk()
+            }
+            
+            // Create bookmarks in background (non-blocking)
+            if !copyFiles {
+                DispatchQueue.global(qos: .utility).async {
+                    // Each bookmark is independent (own file, own resolve) - create them concurrently
+                    DispatchQueue.concurrentPerform(iterations: newFiles.count) { index in
+                        var file = newFiles[index]
+                        file.populateMetadata()
+                        
+                        if let bookmarkData = file.bookmarkData {
+                            FilesManager.saveBookmark(bookmarkData, for: file.id)
+                            #if DEBUG
+                            print("📑 Saved bookmark to cache for: \(file.name)")
+                            #endif
+                        }
                     }
                 }
             }
@@ -363,7 +580,7 @@ class FilesManager: ObservableObject {
     
     func removeFile(_ file: FileItem) {
         // If file is in our storage folder, delete it
-        if let storageFolder = storageFolderURL, isFileInStorage(file.url, storageFolder: storageFolder) {
+        if FilesManager.isFileInStorage(file.url) {
             do {
                 try FileManager.default.removeItem(at: file.url)
             } catch {
@@ -379,21 +596,8 @@ class FilesManager: ObservableObject {
     }
     
     func clearAll() {
-        // Delete all copied files
-        if let storageFolder = storageFolderURL {
-            for file in files where isFileInStorage(file.url, storageFolder: storageFolder) {
-                do {
-                    try FileManager.default.removeItem(at: file.url)
-                } catch {
-                    print("⚠️ Failed to delete stored file: \(error.localizedDescription)")
-                }
-            }
-        }
-        
-        // Delete all bookmark caches
-        for file in files {
-            FilesManager.deleteBookmark(for: file.id)
-        }
+        // Delete all copied files and bookmark caches in one background batch
+        FilesManager.deleteFromDisk(files)
         
         files.removeAll()
         saveToDisk()
@@ -401,47 +605,80 @@ class FilesManager: ObservableObject {
     
     func clearAllReferences() {
         // Remove only referenced files (not stored in app)
-        guard let storageFolder = storageFolderURL else {
+        guard FilesManager.storageFolderURL != nil else {
             // Delete all bookmark caches
-            for file in files {
-                FilesManager.deleteBookmark(for: file.id)
-            }
+            FilesManager.deleteFromDisk(files)
             files.removeAll()
             saveToDisk()
             return
         }
         
-        // Delete bookmarks for reference files
-        let referencedFiles = files.filter { !isFileInStorage($0.url, storageFolder: storageFolder) }
-        for file in referencedFiles {
-            FilesManager.deleteBookmark(for: file.id)
+        // Split in one pass - each storage check standardizes the file's path
+        var storedFiles: [FileItem] = []
+        var referencedFiles: [FileItem] = []
+        for file in files {
+            if FilesManager.isFileInStorage(file.url) {
+                storedFiles.append(file)
+            } else {
+                referencedFiles.append(file)
+            }
         }
         
-        files.removeAll { !isFileInStorage($0.url, storageFolder: storageFolder) }
+        // Delete bookmarks for reference files
+        FilesManager.deleteFromDisk(referencedFiles)
+        
+        files = storedFiles
         saveToDisk()
     }
     
     func clearAllStored() {
         // Delete all stored files but keep references
-        guard let storageFolder = storageFolderURL else { return }
-        
-        let storedFiles = files.filter { isFileInStorage($0.url, storageFolder: storageFolder) }
+        guard FilesManager.storageFolderURL != nil else { return }
         
-        for file in storedFiles {
-            do {
-                try FileManager.default.removeItem(at: file.url)
-            } catch {
-                print("⚠️ Failed to delete stored file: \(error.localizedDescription)")
+        // Same single pass: stored copies go, everything else stays
+        var storedFiles: [FileItem] = []
+        var referencedFiles: [FileItem] = []
+        for file in files {
+            if FilesManager.isFileInStorage(file.url) {
+                storedFiles.append(file)
+            } else {
+                referencedFiles.append(file)
             }
         }
         
-        files.removeAll { isFileInStorage($0.url, storageFolder: storageFolder) }
+        FilesManager.deleteFromDisk(storedFiles)
+        
+        files = referencedFiles
         saveToDisk()
     }
     
-    private func isFileInStorage(_ fileURL: URL, storageFolder: URL) -> Bool {
+    // Disk cleanup for a batch of removed items: stored copies are deleted and bookmark
+    // caches dropped on one utility-queue pass, so clearing a full tray doesn't block
+    // the main thread on a hundred deletions. The list is updated by the caller right away.
+    private static func deleteFromDisk(_ removedFiles: [FileItem]) {
+        guard !removedFiles.isEmpty else { return }
+        
+        DispatchQueue.global(qos: .utility).async {
+            for file in removedFiles {
+                if isFileInStorage(file.url) {
+                    do {
+                        try FileManager.default.removeItem(at: file.url)
+                    } catch {
+                        print("⚠️ Failed to delete stored file: \(error.localizedDescription)")
+                    }
+                }
+                deleteBookmark(for: file.id)
+            }
+        }
+    }
+    
+    // Storage path is standardized once rather than on every comparison.
+    // Nonisolated because deleteFromDisk checks stored files from the utility queue
+    nonisolated private static let standardizedStoragePath: String? = storageFolderURL?.standardizedFileURL.path
+    
+    nonisolated static func isFileInStorage(_ fileURL: URL) -> Bool {
+        guard let storageStandardized = standardizedStoragePath else { return false }
         let fileStandardized = fileURL.standardizedFileURL.path
-        let storageStandardized = storageFolder.standardizedFileURL.path
         return fileStandardized.hasPrefix(storageStandardized)
     }
     
@@ -479,11 +716,29 @@ class FilesManager: ObservableObject {
         NSWorkspace.shared.activateFileViewerSelecting([resolvedURL])
     }
     
+    // Last search and its result - FilesView reads filteredFiles several times per
+    // render (and per arrow key), so repeat reads for the same query skip the filter.
+    // Invalidated whenever `files` changes.
+    private var filteredFilesCache: (query: String, result: [FileItem])?
+    
     var filteredFiles: [FileItem] {
         if searchText.isEmpty {
             return files
         }
-        return files.filter { $0.name.localizedCaseInsensitiveContains(searchText) }
+        // Typing extends the query, and anything matching the longer query also matched
+        // the previous one - so narrow the last result instead of rescanning every file
+        var candidates = files
+        if let cache = filteredFilesCache {
+            if cache.query == searchText {
+                return cache.result
+            }
+            if searchText.hasPrefix(cache.query) {
+                candidates = cache.result
+            }
+        }
+        let result = candidates.filter { $0.name.localizedCaseInsensitiveContains(searchText) }
+        filteredFilesCache = (searchText, result)
+        return result
     }
     
     func getFilesForDragging(_ file: FileItem) -> [URL] {
@@ -491,36 +746,40 @@ class FilesManager: ObservableObject {
     }
     
     func openStorageFolder() {
-        guard let storageFolder = storageFolderURL else {
+        guard let storageFolder = FilesManager.storageFolderURL else {
             print("❌ Storage folder not available")
             return
         }
+        try? FileManager.default.createDirectory(at: storageFolder, withIntermediateDirectories: true)
         NSWorkspace.shared.selectFile(nil, inFileViewerRootedAtPath: storageFolder.path)
     }
     
     // MARK: - Persistence
     
-    private var saveURL: URL {
+    // Static so the path lookup + mkdir happens once, not on every debounced save
+    nonisolated private static let saveURL: URL = {
         let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first!
         let appFolder = appSupport.appendingPathComponent("TrayMe", isDirectory: true)
         try? FileManager.default.createDirectory(at: appFolder, withIntermediateDirectories: true)
         return appFolder.appendingPathComponent("files.json")
-    }
+    }()
     
     func saveToDisk() {
         // Cancel any pending save
         saveWorkItem?.cancel()
         
+        // Capture the list here on main - the work item runs on a background
+        // queue and reading self.files there raced with main-thread mutations
+        let snapshot = files
+        
         // Create new debounced save task
-        let workItem = DispatchWorkItem { [weak self] in
-            guard let self = self else { return }
-            
-            let encoder = JSONEncoder()
-            encoder.dateEncodingStrategy = .iso8601
-            encoder.outputFormatting = [] // No pretty printing for speed
+        let workItem = DispatchWorkItem {
+            let encoder = JSONEncoder.persistence
             
-            if let data = try? encoder.encode(self.files) {
-                try? data.write(to: self.saveURL, options: .atomic)
+            if let data = try? encoder.encode(snapshot) {
+                // Recreate the app folder if it was removed since launch (no-op when present)
+                try? FileManager.default.createDirectory(at: FilesManager.saveURL.deletingLastPathComponent(), withIntermediateDirectories: true)
+                try? data.write(to: FilesManager.saveURL, options: .atomic)
             }
         }
         
@@ -4,6 +4,7 @@
 //
 
 import SwiftUI
+import AppKit
 import Combine
 
 class NotesManager: ObservableObject {
@@ -11,9 +12,27 @@ class NotesManager: ObservableObject {
     @Published var searchText: String = ""
     @Published var selectedNote: Note?
     
+    // Pending save - title/content edits, pins and deletes are flushed in one write.
+    // Cleared once the write lands, so flushing with nothing pending does no work
+    private var saveWorkItem: DispatchWorkItem?
+    private let saveDebounceInterval: TimeInterval = 0.5
+    // Every write goes through one serial queue, so an older snapshot can never land
+    // after a newer one (debounced or flushed)
+    private static let saveQueue = DispatchQueue(label: "TrayMe.NotesManager.save", qos: .utility)
+    private var terminationObserver: NSObjectProtocol?
+    
     init() {
         loadFromDisk()
         
+        // Don't lose the last edit to the debounce when the app quits
+        terminationObserver = NotificationCenter.default.addObserver(
+            forName: NSApplication.willTerminateNotification,
+            object: nil,
+            queue: .main
+        ) { [weak self] _ in
+            self?.flush()
+        }
+        
         // Create a default note if empty
         if notes.isEmpty {
             _ = createNote()
@@ -32,6 +51,13 @@ class NotesManager: ObservableObject {
     
     func updateNote(_ note: Note, title: String? = nil, content: String? = nil) {
         if let index = notes.firstIndex(where: { $0.id == note.id }) {
+            // Switching notes and hiding the panel flush the editor even when nothing
+            // was typed - skip the rewrite (and the modified-date bump) in that case
+            let current = notes[index]
+            let titleChanged = title.map { $0 != current.title } ?? false
+            let contentChanged = content.map { $0 != current.content } ?? false
+            guard titleChanged || contentChanged else { return }
+            
             notes[index].update(title: title, content: content)
             saveToDisk()
         }
@@ -83,29 +109,59 @@ class NotesManager: ObservableObject {
     
     // MARK: - Persistence
     
-    private var saveURL: URL {
+    nonisolated private static let saveURL: URL = {
         let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first!
         let appFolder = appSupport.appendingPathComponent("TrayMe", isDirectory: true)
         try? FileManager.default.createDirectory(at: appFolder, withIntermediateDirectories: true)
         return appFolder.appendingPathComponent("notes.json")
-    }
+    }()
     
     func saveToDisk() {
-        let encoder = JSONEncoder()
-        encoder.dateEncodingStrategy = .iso8601
+        saveWorkItem?.cancel()
+        
+        // Encode a copy of the notes taken now, on the main thread
+        let snapshot = notes
+        let workItem = DispatchWorkItem {
+            let encoder = JSONEncoder.persistence
+            
+            if let data = try? encoder.encode(snapshot) {
+                // Make sure the folder still exists - it's only created once at launch
+                try? FileManager.default.createDirectory(at: NotesManager.saveURL.deletingLastPathComponent(), withIntermediateDirectories: true)
+                try? data.write(to: NotesManager.saveURL, options: .atomic)
+            }
+        }
+        
+        // Clear the pending flag once this write is done (unless a newer save replaced it)
+        workItem.notify(queue: .main) { [weak self] in
+            if self?.saveWorkItem === workItem {
+                self?.saveWorkItem = nil
+            }
+        }
+        
+        saveWorkItem = workItem
+        NotesManager.saveQueue.asyncAfter(deadline: .now() + saveDebounceInterval, execute: workItem)
+    }
+    
+    // Write the pending save right now and wait for it - for the editor's
+    // "save immediately" paths (note switch, panel hide) and app termination
+    func flush() {
+        guard let workItem = saveWorkItem else { return }
+        saveWorkItem = nil
         
-        if let data = try? encoder.encode(notes) {
-            try? data.write(to: saveURL)
+        // On the save queue, so it's ordered after any write already in flight
+        NotesManager.saveQueue.sync {
+            workItem.perform()
+            // Stop the queued copy from writing the same snapshot again
+            workItem.cancel()
         }
     }
     
     func loadFromDisk() {
-        guard FileManager.default.fileExists(atPath: saveURL.path) else { return }
+        guard FileManager.default.fileExists(atPath: NotesManager.saveURL.path) else { return }
         
-        let decoder = JSONDecoder()
-        decoder.dateDecodingStrategy = .iso8601
+        let decoder = JSONDecoder.persistence
         
-        if let data = try? Data(contentsOf: saveURL),
+        if let data = try? Data(contentsOf: NotesManager.saveURL, options: .mappedIfSafe),
            let decoded = try? decoder.decode([Note].self, from: data) {
             self.notes = decoded
             self.selectedNote = decoded.first
@@ -6,6 +6,13 @@
 import Foundation
 import AppKit
 
+// Static formatter - timeAgo is evaluated for every visible row on each render
+private let sharedRelativeDateFormatter: RelativeDateTimeFormatter = {
+    let formatter = RelativeDateTimeFormatter()
+    formatter.unitsStyle = .abbreviated
+    return formatter
+}()
+
 struct ClipboardItem: Identifiable, Codable, Equatable {
     let id: UUID
     let content: String
@@ -38,15 +45,15 @@ struct ClipboardItem: Identifiable, Codable, Equatable {
     
     var displayContent: String {
         let maxLength = 100
-        if content.count > maxLength {
-            return String(content.prefix(maxLength)) + "..."
+        // Walk at most maxLength characters - count would traverse the whole clip
+        let head = content.prefix(maxLength)
+        if head.endIndex < content.endIndex {
+            return String(head) + "..."
         }
         return content
     }
     
     var timeAgo: String {
-        let formatter = RelativeDateTimeFormatter()
-        formatter.unitsStyle = .abbreviated
-        return formatter.localizedString(for: timestamp, relativeTo: Date())
+        return sharedRelativeDateFormatter.localizedString(for: timestamp, relativeTo: Date())
     }
 }
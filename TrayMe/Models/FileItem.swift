@@ -6,6 +6,13 @@
 import Foundation
 import AppKit
 
+// Configured once - formattedSize is read by every file card on each render
+private let sharedByteCountFormatter: ByteCountFormatter = {
+    let formatter = ByteCountFormatter()
+    formatter.countStyle = .file
+    return formatter
+}()
+
 struct FileItem: Identifiable, Codable {
     let id: UUID
     let url: URL
@@ -16,20 +23,18 @@ struct FileItem: Identifiable, Codable {
     var iconData: Data?
     var bookmarkData: Data?  // Security-scoped bookmark
     
-    init(url: URL) {
+    // nonisolated - FilesManager builds items on its file processing queue
+    nonisolated init(url: URL) {
         self.id = UUID()
         self.url = url
         self.name = url.lastPathComponent
         self.fileType = url.pathExtension
         self.addedDate = Date()
         
-        // Get file size - quick operation
-        do {
-            let attributes = try FileManager.default.attributesOfItem(atPath: url.path)
-            self.size = attributes[.size] as? Int64 ?? 0
-        } catch {
-            self.size = 0
-        }
+        // Get file size - asks for just this one resource value instead of building
+        // the whole attributes dictionary (owner, dates, permissions, ...)
+        let fileSize = (try? url.resourceValues(forKeys: [.fileSizeKey]))?.fileSize ?? 0
+        self.size = Int64(fileSize)
         
         // Defer heavy operations - will be done asynchronously after creation
         self.iconData = nil
@@ -42,7 +47,9 @@ struct FileItem: Identifiable, Codable {
     
     // Helper to populate bookmark data asynchronously (only for referenced files)
     nonisolated mutating func populateMetadata() {
+        #if DEBUG
         print("🔖 populateMetadata called for: \(url.lastPathComponent)")
+        #endif
         
         // Create security-scoped bookmark for referenced files
         do {
@@ -51,16 +58,25 @@ struct FileItem: Identifiable, Codable {
                 includingResourceValuesForKeys: nil,
                 relativeTo: nil
             )
+            #if DEBUG
             print("✅ Bookmark created successfully for: \(url.lastPathComponent)")
             print("✅ Bookmark data size: \(bookmarkData?.count ?? 0) bytes")
+            #endif
         } catch {
             print("❌ Failed to create bookmark for \(url.lastPathComponent): \(error.localizedDescription)")
             self.bookmarkData = nil
         }
     }
     
+    // Image types that get real thumbnails (and "Copy Image") instead of a workspace icon
+    nonisolated private static let imageExtensions: Set<String> = ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "heic", "webp"]
+    
+    nonisolated var isImage: Bool {
+        FileItem.imageExtensions.contains(fileType.lowercased())
+    }
+    
     var formattedSize: String {
-        ByteCountFormatter.string(fromByteCount: size, countStyle: .file)
+        sharedByteCountFormatter.string(fromByteCount: size)
     }
     
     var icon: NSImage? {
@@ -84,13 +100,16 @@ struct FileItem: Identifiable, Codable {
             return false
         }
         let exists = FileManager.default.fileExists(atPath: url.path)
+        #if DEBUG
         print("📁 fileExists check for \(name): \(exists) at \(url.path)")
+        #endif
         return exists
     }
     
     // Helper to resolve URL from bookmark if available
     // Bookmarks are stored separately for fast JSON loading
-    func resolvedURL() -> URL? {
+    // nonisolated - the thumbnail prewarm resolves URLs on a background queue
+    nonisolated func resolvedURL() -> URL? {
         // Try to load bookmark from cache first
         let bookmarkData = FilesManager.loadBookmark(for: id) ?? self.bookmarkData
         
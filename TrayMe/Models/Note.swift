@@ -36,15 +36,18 @@ struct Note: Identifiable, Codable {
         if !title.isEmpty {
             return title
         }
-        // Extract first line from content
-        let firstLine = content.components(separatedBy: .newlines).first ?? "Untitled Note"
+        // Extract first line from content - scan up to the first line break only
+        // instead of splitting the whole note into lines
+        let firstLine = content.prefix { !$0.isNewline }
         return firstLine.isEmpty ? "Untitled Note" : String(firstLine.prefix(30))
     }
     
     var preview: String {
         let maxLength = 100
-        if content.count > maxLength {
-            return String(content.prefix(maxLength)) + "..."
+        // Stop after maxLength characters rather than counting the whole note
+        let head = content.prefix(maxLength)
+        if head.endIndex < content.endIndex {
+            return String(head) + "..."
         }
         return content
     }
@@ -56,50 +56,44 @@ class AppSettings: ObservableObject {
     
     private var isLoading = false
     
+    // Every persisted setting: UserDefaults key -> property
+    // Loading and saving both walk this one table instead of repeating each key by hand
+    private static let persistedSettings: [(key: String, keyPath: PartialKeyPath<AppSettings>)] = [
+        ("enableMouseActivation", \AppSettings.enableMouseActivation),
+        ("enableHotkeyActivation", \AppSettings.enableHotkeyActivation),
+        ("hotkeyModifiers", \AppSettings.hotkeyModifiers),
+        ("hotkeyKey", \AppSettings.hotkeyKey),
+        ("clipboardMaxHistory", \AppSettings.clipboardMaxHistory),
+        ("ignorePasswordManagers", \AppSettings.ignorePasswordManagers),
+        ("clipboardEnabled", \AppSettings.clipboardEnabled),
+        ("filesMaxStorage", \AppSettings.filesMaxStorage),
+        ("filesEnabled", \AppSettings.filesEnabled),
+        ("notesEnabled", \AppSettings.notesEnabled),
+        ("notesSyncWithiCloud", \AppSettings.notesSyncWithiCloud),
+        ("panelWidth", \AppSettings.panelWidth),
+        ("panelHeight", \AppSettings.panelHeight),
+        ("defaultTab", \AppSettings.defaultTab)
+    ]
+    
     init() {
         isLoading = true
-        // Load from UserDefaults if available
-        if let saved = UserDefaults.standard.object(forKey: "enableMouseActivation") as? Bool {
-            enableMouseActivation = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "enableHotkeyActivation") as? Bool {
-            enableHotkeyActivation = saved
-        }
-        if let saved = UserDefaults.standard.string(forKey: "hotkeyModifiers") {
-            hotkeyModifiers = saved
-        }
-        if let saved = UserDefaults.standard.string(forKey: "hotkeyKey") {
-            hotkeyKey = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "clipboardMaxHistory") as? Int {
-            clipboardMaxHistory = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "ignorePasswordManagers") as? Bool {
-            ignorePasswordManagers = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "clipboardEnabled") as? Bool {
-            clipboardEnabled = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "filesMaxStorage") as? Int {
-            filesMaxStorage = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "filesEnabled") as? Bool {
-            filesEnabled = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "notesEnabled") as? Bool {
-            notesEnabled = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "notesSyncWithiCloud") as? Bool {
-            notesSyncWithiCloud = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "panelWidth") as? Double {
-            panelWidth = saved
-        }
-        if let saved = UserDefaults.standard.object(forKey: "panelHeight") as? Double {
-            panelHeight = saved
-        }
-        if let saved = UserDefaults.standard.string(forKey: "defaultTab") {
-            defaultTab = saved
+        // Load from UserDefaults if available (one lookup per key)
+        let defaults = UserDefaults.standard
+        for setting in AppSettings.persistedSettings {
+            guard let saved = defaults.object(forKey: setting.key) else { continue }
+            
+            switch setting.keyPath {
+            case let keyPath as ReferenceWritableKeyPath<AppSettings, Bool>:
+                if let value = saved as? Bool { self[keyPath: keyPath] = value }
+            case let keyPath as ReferenceWritableKeyPath<AppSettings, Int>:
+                if let value = saved as? Int { self[keyPath: keyPath] = value }
+            case let keyPath as ReferenceWritableKeyPath<AppSettings, Double>:
+                if let value = saved as? Double { self[keyPath: keyPath] = value }
+            case let keyPath as ReferenceWritableKeyPath<AppSettings, String>:
+                if let value = saved as? String { self[keyPath: keyPath] = value }
+            default:
+                break
+            }
         }
         isLoading = false
     }
@@ -108,19 +102,9 @@ class AppSettings: ObservableObject {
         // Don't save during initial load
         guard !isLoading else { return }
         
-        UserDefaults.standard.set(enableMouseActivation, forKey: "enableMouseActivation")
-        UserDefaults.standard.set(enableHotkeyActivation, forKey: "enableHotkeyActivation")
-        UserDefaults.standard.set(hotkeyModifiers, forKey: "hotkeyModifiers")
-        UserDefaults.standard.set(hotkeyKey, forKey: "hotkeyKey")
-        UserDefaults.standard.set(clipboardMaxHistory, forKey: "clipboardMaxHistory")
-        UserDefaults.standard.set(ignorePasswordManagers, forKey: "ignorePasswordManagers")
-        UserDefaults.standard.set(clipboardEnabled, forKey: "clipboardEnabled")
-        UserDefaults.standard.set(filesMaxStorage, forKey: "filesMaxStorage")
-        UserDefaults.standard.set(filesEnabled, forKey: "filesEnabled")
-        UserDefaults.standard.set(notesEnabled, forKey: "notesEnabled")
-        UserDefaults.standard.set(notesSyncWithiCloud, forKey: "notesSyncWithiCloud")
-        UserDefaults.standard.set(panelWidth, forKey: "panelWidth")
-        UserDefaults.standard.set(panelHeight, forKey: "panelHeight")
-        UserDefaults.standard.set(defaultTab, forKey: "defaultTab")
-    }
-}
\ No newline at end of file
+        let defaults = UserDefaults.standard
+        for setting in AppSettings.persistedSettings {
+            defaults.set(self[keyPath: setting.keyPath], forKey: setting.key)
+        }
+    }
+}
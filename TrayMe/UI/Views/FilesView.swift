@@ -36,9 +36,6 @@ struct FilesView: View {
         static let upArrow: UInt16 = 126
     }
     
-    // Supported image file extensions (fileprivate to allow access from FileCard)
-    fileprivate static let imageExtensions = ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "heic", "webp"]
-    
     enum ClearAction {
         case allReferences
         case allStored
@@ -454,18 +451,20 @@ struct FilesView: View {
             
             // Handle arrow keys for navigation when Quick Look is shown
             if let panel = QLPreviewPanel.shared(), panel.isVisible {
-                let currentIndex = manager.filteredFiles.firstIndex { $0.id == selectedFile?.id } ?? 0
+                // Read the filtered list once per key press and index into that
+                let visibleFiles = manager.filteredFiles
+                let currentIndex = visibleFiles.firstIndex { $0.id == selectedFile?.id } ?? 0
                 
                 switch event.keyCode {
                 case KeyCode.leftArrow, KeyCode.upArrow: // Left arrow or Up arrow - previous file
                     if currentIndex > 0 {
-                        selectedFile = manager.filteredFiles[currentIndex - 1]
+                        selectedFile = visibleFiles[currentIndex - 1]
                         quickLookTrigger = true
                         return nil
                     }
                 case KeyCode.rightArrow, KeyCode.downArrow: // Right arrow or Down arrow - next file
-                    if currentIndex < manager.filteredFiles.count - 1 {
-                        selectedFile = manager.filteredFiles[currentIndex + 1]
+                    if currentIndex < visibleFiles.count - 1 {
+                        selectedFile = visibleFiles[currentIndex + 1]
                         quickLookTrigger = true
                         return nil
                     }
@@ -509,7 +508,8 @@ struct FilesView: View {
     
     func handleDrop(providers: [NSItemProvider]) {
         let dropCount = providers.count
-        let currentCount = manager.files.count
+        // Files from earlier drops that are still copying take up slots too
+        let currentCount = manager.files.count + manager.pendingFileCount
         let availableSlots = manager.maxFiles - currentCount
         
         // Check if drop would exceed limit
@@ -520,21 +520,27 @@ struct FilesView: View {
         }
         
         // Collect all URLs first, then batch add
-        var urlsToAdd: [URL] = []
+        // Providers load concurrently - each writes its own slot (under a lock) so the
+        // callbacks don't race on a shared array and the drop order is preserved
+        var loadedURLs = [URL?](repeating: nil, count: providers.count)
+        let resultsLock = NSLock()
         let group = DispatchGroup()
         
-        for provider in providers {
+        for (index, provider) in providers.enumerated() {
             group.enter()
             provider.loadItem(forTypeIdentifier: UTType.fileURL.identifier, options: nil) { (item, error) in
                 defer { group.leave() }
                 if let data = item as? Data,
                    let url = URL(dataRepresentation: data, relativeTo: nil) {
-                    urlsToAdd.append(url)
+                    resultsLock.lock()
+                    loadedURLs[index] = url
+                    resultsLock.unlock()
                 }
             }
         }
         
         group.notify(queue: .main) {
+            let urlsToAdd = loadedURLs.compactMap { $0 }
             if !urlsToAdd.isEmpty {
                 manager.addFiles(urls: urlsToAdd)
             }
@@ -582,6 +588,7 @@ struct FileCard: View {
     @State private var isCopiedFile: Bool = false
     @State private var imageThumbnail: NSImage? = nil
     @State private var isFileMissing: Bool = false
+    @State private var workspaceIcon: NSImage? = nil
     @Binding var showCopiedFeedback: Bool
     let refreshTrigger: UUID // When this changes, re-check file status
     
@@ -592,12 +599,13 @@ struct FileCard: View {
             return thumb
         }
         
-        if let resolvedURL = file.resolvedURL() {
-            // Native workspace icon - instant and perfect
-            return NSWorkspace.shared.icon(forFile: resolvedURL.path)
+        // Workspace icon resolved on appear (see loadWorkspaceIcon)
+        if let icon = workspaceIcon {
+            return icon
         }
-        // Fallback to file type icon
-        if let icon = file.icon {
+        // Fallback to file type icon (images skip it - they wait for the thumbnail, or the
+        // workspace icon if it can't be made, without hitting NSWorkspace on every render)
+        if !file.isImage, let icon = file.icon {
             return icon
         }
         // Ultimate fallback - use modern API
@@ -743,11 +751,23 @@ struct FileCard: View {
         }
         .onAppear {
             checkFileStatus()
-            loadImageThumbnail()
+            // Images load their thumbnail first and only fall back to the workspace icon
+            if file.isImage {
+                loadImageThumbnail()
+            } else {
+                loadWorkspaceIcon()
+            }
         }
         .onChange(of: refreshTrigger) {
-            // Re-check file status when refresh is triggered
+            // Re-check file status (and the icon - a restored file gets its real one back)
             checkFileStatus()
+            if file.isImage {
+                if imageThumbnail == nil {
+                    loadImageThumbnail()
+                }
+            } else {
+                loadWorkspaceIcon()
+            }
         }
         .contextMenu {
             Text(isCopiedFile ? "📦 Stored File" : "🔗 Referenced File")
@@ -764,7 +784,7 @@ struct FileCard: View {
             }
             
             // Only show "Copy Image" for image files
-            if FilesView.imageExtensions.contains(file.fileType.lowercased()) {
+            if file.isImage {
                 Button("Copy Image") {
                     copyFullImageToClipboard()
                 }
@@ -778,24 +798,32 @@ struct FileCard: View {
         }
     }
     
+    func loadWorkspaceIcon() {
+        // Resolved on appear and on refresh only - the bookmark lookup reads from disk,
+        // and hover or selection changes re-render the card many times.
+        // Image cards only get here when their thumbnail can't be made.
+        guard let resolvedURL = file.resolvedURL() else { return }
+        
+        // Native workspace icon - instant and perfect
+        workspaceIcon = NSWorkspace.shared.icon(forFile: resolvedURL.path)
+    }
+    
     func checkFileStatus() {
-        // Compute isCopiedFile once on appear
-        if let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask).first {
-            let storageFolder = appSupport.appendingPathComponent("TrayMe/StoredFiles")
-            let fileStandardized = file.url.standardizedFileURL.path
-            let storageStandardized = storageFolder.standardizedFileURL.path
-            isCopiedFile = fileStandardized.hasPrefix(storageStandardized)
-        }
+        // Compute isCopiedFile once on appear (storage path is precomputed by the manager)
+        isCopiedFile = FilesManager.isFileInStorage(file.url)
         
         // Check if reference file still exists (only for reference files)
         if !isCopiedFile {
+            #if DEBUG
             print("🔍 Checking if reference file exists: \(file.name)")
+            #endif
             Task(priority: .utility) {
                 let exists = file.fileExists()
+                #if DEBUG
                 print("🔍 File existence result for \(file.name): \(exists)")
+                #endif
                 await MainActor.run {
                     isFileMissing = !exists
-                    print("🔍 Set isFileMissing = \(isFileMissing) for \(file.name)")
                 }
             }
         }
@@ -803,21 +831,17 @@ struct FileCard: View {
     
     func loadImageThumbnail() {
         // Only generate thumbnails for images - everything else uses workspace icons
-        guard FilesView.imageExtensions.contains(file.fileType.lowercased()) else {
+        guard file.isImage else {
             return // Non-images get workspace icons (instant)
         }
         
         guard let resolvedURL = file.resolvedURL() else { return }
         
-        // Check cache FIRST (super fast - just file read, no JSON parsing!)
-        if let cached = FilesManager.getCachedThumbnail(for: resolvedURL) {
-            self.imageThumbnail = cached
-            return
-        }
-        
-        // Generate thumbnail in background if not cached
-        Task(priority: .utility) {
-            // Start security-scoped access
+        // Cache lookup and generation both run off the main thread - the cache hit
+        // still costs a stat, a file read and a PNG decode per card.
+        // Detached so it doesn't inherit the view's main-actor context.
+        Task.detached(priority: .utility) {
+            // Start security-scoped access (the cache key reads mtime/size too)
             let isAccessing = resolvedURL.startAccessingSecurityScopedResource()
             defer {
                 if isAccessing {
@@ -825,34 +849,21 @@ struct FileCard: View {
                 }
             }
             
-            // Load and resize image using modern NSGraphicsContext API
-            guard let image = NSImage(contentsOf: resolvedURL) else { return }
-            
-            let targetSize = CGSize(width: 160, height: 120)
-            let thumbnail = NSImage(size: targetSize)
+            // Check cache FIRST (just a file read, no JSON parsing)
+            if let cached = FilesManager.getCachedThumbnail(for: resolvedURL) {
+                await MainActor.run {
+                    self.imageThumbnail = cached
+                }
+                return
+            }
             
-            // Use modern NSGraphicsContext API instead of deprecated lockFocus
-            if let bitmapRep = NSBitmapImageRep(
-                bitmapDataPlanes: nil,
-                pixelsWide: Int(targetSize.width),
-                pixelsHigh: Int(targetSize.height),
-                bitsPerSample: 8,
-                samplesPerPixel: 4,
-                hasAlpha: true,
-                isPlanar: false,
-                colorSpaceName: .deviceRGB,
-                bytesPerRow: 0,
-                bitsPerPixel: 0
-            ) {
-                NSGraphicsContext.saveGraphicsState()
-                NSGraphicsContext.current = NSGraphicsContext(bitmapImageRep: bitmapRep)
-                
-                let imageRect = NSRect(origin: .zero, size: image.size)
-                let thumbnailRect = NSRect(origin: .zero, size: targetSize)
-                image.draw(in: thumbnailRect, from: imageRect, operation: .copy, fraction: 1.0)
-                
-                NSGraphicsContext.restoreGraphicsState()
-                thumbnail.addRepresentation(bitmapRep)
+            // Downsample straight from the file (ImageIO) - never decodes the full image
+            guard let thumbnail = FilesManager.makeThumbnail(for: resolvedURL) else {
+                // Unreadable or unsupported image - show its workspace icon instead
+                await MainActor.run {
+                    self.loadWorkspaceIcon()
+                }
+                return
             }
             
             // Cache to disk for next time (PNG is small and fast)
@@ -866,7 +877,7 @@ struct FileCard: View {
     
     func copyFullImageToClipboard() {
         // Only copy if the file is an image
-        guard FilesView.imageExtensions.contains(file.url.pathExtension.lowercased()) else {
+        guard file.isImage else {
             print("⚠️ Cannot copy non-image file to clipboard")
             return
         }
@@ -200,6 +200,9 @@ struct NotesView: View {
                 print("📝 Saving note on disappear: \(currentNote.displayTitle)")
                 manager.updateNote(currentNote, title: noteTitle, content: noteContent)
             }
+            
+            // The manager debounces its writes - push this one to disk now
+            manager.flush()
         }
         .onReceive(NotificationCenter.default.publisher(for: .focusNotes)) { _ in
             print("📝 FocusNotes notification received!")
@@ -221,6 +224,7 @@ struct NotesView: View {
            currentNote.id != note.id {
             print("📝 Saving previous note before switching")
             manager.updateNote(currentNote, title: noteTitle, content: noteContent)
+            manager.flush()
         }
         
         manager.selectedNote = note
@@ -0,0 +1,27 @@
+//
+//  JSONCoders.swift
+//  TrayMe
+//
+
+import Foundation
+
+// Shared coders for the managers' JSON persistence (clipboard/files/notes).
+// They are configured once and never mutated afterwards, so one instance is
+// reused for every save/load instead of building a new coder each time.
+// Nonisolated because the saves and the files load run on background queues.
+extension JSONEncoder {
+    nonisolated static let persistence: JSONEncoder = {
+        let encoder = JSONEncoder()
+        encoder.dateEncodingStrategy = .iso8601
+        encoder.outputFormatting = [] // No pretty printing for speed
+        return encoder
+    }()
+}
+
+extension JSONDecoder {
+    nonisolated static let persistence: JSONDecoder = {
+        let decoder = JSONDecoder()
+        decoder.dateDecodingStrategy = .iso8601
+        return decoder
+    }()
+}